@@ -1,10 +1,12 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-import os
-import json
+import functools
+import bisect
+import string
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from types import MappingProxyType
 
 # Set page config
 st.set_page_config(
@@ -17,30 +19,35 @@ st.set_page_config(
 # UTILITY FUNCTIONS
 #############################
 
+# Score band lower bounds and their colors: Red, Orange, Amber, Light Green, Green
+_SCORE_COLOR_BOUNDS = (20, 40, 60, 80)
+_SCORE_COLORS = ("#F44336", "#FF9800", "#FFC107", "#8BC34A", "#4CAF50")
+
+# Color for every whole score 0-100; band bounds are whole numbers, so truncating
+# a fractional score never changes its band
+_SCORE_COLOR_TABLE = tuple(
+    _SCORE_COLORS[bisect.bisect_right(_SCORE_COLOR_BOUNDS, score)] for score in range(101)
+)
+
 def get_score_color(score):
     """Return a color corresponding to a sustainability score"""
-    if score >= 80:
-        return "#4CAF50"  # Green
-    elif score >= 60:
-        return "#8BC34A"  # Light Green
-    elif score >= 40:
-        return "#FFC107"  # Amber
-    elif score >= 20:
-        return "#FF9800"  # Orange
-    else:
-        return "#F44336"  # Red
+    return _SCORE_COLOR_TABLE[min(max(int(score), 0), 100)]
 
 def normalize_value(value, min_val, max_val, reverse=False):
-    """Normalize a value to a 0-100 scale"""
+    """Normalize a value (or array of values) to a 0-100 scale"""
+    value = np.asarray(value, dtype=float)
+    
     if max_val == min_val:
-        return 50  # Default to middle if range is zero
+        normalized = np.full(value.shape, 50.0)  # Default to middle if range is zero
+    else:
+        normalized = ((value - min_val) / (max_val - min_val)) * 100
         
-    normalized = ((value - min_val) / (max_val - min_val)) * 100
-    
-    if reverse:
-        normalized = 100 - normalized
+        if reverse:
+            normalized = 100 - normalized
         
-    return max(0, min(100, normalized))
+        normalized = np.clip(normalized, 0, 100)
+    
+    return float(normalized) if normalized.ndim == 0 else normalized
 
 def format_percentage(value):
     """Format a decimal value as a percentage string"""
@@ -58,839 +65,864 @@ def format_water(gallons):
     """Format water usage value"""
     return f"{gallons:,} gallons"
 
+class Category(IntEnum):
+    """Recommendation categories; values index _CATEGORY_ICONS"""
+    TRANSPORTATION = 0
+    ENERGY = 1
+    WATER = 2
+    WASTE = 3
+    FOOD = 4
+    ACTIVITIES = 5
+    ACCOMMODATION = 6
+    GENERAL = 7
+
+_CATEGORY_ICONS = ("🚗", "⚡", "💧", "🗑️", "🍲", "🏄‍♀️", "🏨", "🌱")
+
 def get_recommendation_icon(category):
-    """Return an icon for a recommendation category"""
-    icons = {
-        "transportation": "🚗",
-        "energy": "⚡",
-        "water": "💧",
-        "waste": "🗑️",
-        "food": "🍲",
-        "activities": "🏄‍♀️",
-        "accommodation": "🏨",
-        "general": "🌱"
-    }
-    
-    return icons.get(category.lower(), "🌴")
+    """Return an icon for a recommendation Category"""
+    return _CATEGORY_ICONS[category]
 
 #############################
 # OAHU SPECIFIC DATA
 #############################
 
-def get_oahu_environmental_factors():
-    """
-    Return a dictionary of Oahu-specific environmental factors
-    that influence tourist sustainability calculations.
-    """
-    factors = {
-        'transport': {
-            'traffic_congestion_factor': 0.8,  # Higher means worse traffic
-            'public_transport_quality': 0.6,   # Higher means better public transport
-            'ev_rental_availability': 0.4,     # Availability of EV rentals
-            'avg_tourist_travel_distance': 20  # Average daily tourist travel distance in miles
+# Oahu-specific environmental factors; built once at import since they never change
+_OAHU_FACTORS = {
+    'transport': {
+        'traffic_congestion_factor': 0.8,  # Higher means worse traffic
+        'public_transport_quality': 0.6,   # Higher means better public transport
+        'ev_rental_availability': 0.4,     # Availability of EV rentals
+        'avg_tourist_travel_distance': 20  # Average daily tourist travel distance in miles
+    },
+    'accommodation': {
+        'hotel_energy_intensity': 20.5,    # kWh per guest night
+        'resort_water_intensity': 300,     # Gallons per guest night
+        'green_certified_percentage': 0.25, # Percentage of accommodations with green certification
+        'avg_ac_usage': 8                  # Average hours of AC use per day
+    },
+    'energy': {
+        'electricity_cost': 0.34,          # $ per kWh (highest in the US)
+        'renewable_percentage': 0.35,      # Percentage of grid from renewables
+        'fossil_fuel_dependency': 0.65,    # Dependency on imported fossil fuels
+        'tourism_energy_factor': 1.5       # Tourist energy use vs. resident (multiplier)
+    },
+    'water': {
+        'freshwater_scarcity': 0.7,        # Higher means more scarce
+        'rainfall_variation': 0.7,         # Geographic rainfall variation
+        'tourism_water_factor': 2.0,       # Tourist water use vs. resident (multiplier)
+        'avg_hotel_consumption': 300       # Average per guest daily consumption (gallons)
+    },
+    'waste': {
+        'limited_landfill_space': 0.8,     # Limited landfill capacity
+        'recycling_infrastructure': 0.5,   # Quality of recycling infrastructure
+        'marine_debris_impact': 0.9,       # Impact of waste on marine environment
+        'tourism_waste_factor': 1.8        # Tourist waste vs. resident (multiplier)
+    },
+    'food': {
+        'import_dependency': 0.85,         # Percentage of food imported
+        'local_agriculture_capacity': 0.3, # Capacity for local agriculture
+        'fishing_sustainability': 0.6,     # Sustainability of local fishing
+        'tourist_dining_impact': 1.6       # Tourist dining impact vs. resident (multiplier)
+    },
+    'activities': {
+        'reef_vulnerability': 0.8,         # Vulnerability of coral reefs
+        'trail_erosion_factor': 0.7,       # Impact of hiking on trails
+        'wildlife_disturbance': 0.6,       # Impact on local wildlife
+        'marine_activity_impact': 0.75     # Impact of water activities on marine ecosystems
+    },
+    'carbon': {
+        'island_multiplier': 1.2,          # Island context multiplier for carbon emissions
+        'tourism_impact': 1.5,             # Impact of tourism activities on carbon emissions
+        'flight_emissions_factor': 0.2,    # Tons CO2 per 1000 miles flown
+        'avg_tourist_emissions': 3.2       # Average carbon footprint (tons/tourist/week)
+    }
+}
+
+# Flat, fixed-layout snapshot of _OAHU_FACTORS ('group.name' order) taken at import for the numeric kernels
+_FACTOR_NAMES = tuple(f"{group}.{name}" for group, values in _OAHU_FACTORS.items() for name in values)
+_FACTORS = np.array([value for values in _OAHU_FACTORS.values() for value in values.values()], dtype=float)
+_FACTOR_INDEX = {name: i for i, name in enumerate(_FACTOR_NAMES)}
+
+# Offsets into _FACTORS
+_F_TRAFFIC_CONGESTION = _FACTOR_INDEX['transport.traffic_congestion_factor']
+_F_PUBLIC_TRANSPORT_QUALITY = _FACTOR_INDEX['transport.public_transport_quality']
+_F_EV_AVAILABILITY = _FACTOR_INDEX['transport.ev_rental_availability']
+_F_TRAVEL_DISTANCE = _FACTOR_INDEX['transport.avg_tourist_travel_distance']
+_F_GREEN_CERTIFIED = _FACTOR_INDEX['accommodation.green_certified_percentage']
+_F_TOURISM_ENERGY = _FACTOR_INDEX['energy.tourism_energy_factor']
+_F_FRESHWATER_SCARCITY = _FACTOR_INDEX['water.freshwater_scarcity']
+_F_TOURISM_WATER = _FACTOR_INDEX['water.tourism_water_factor']
+_F_LANDFILL_SPACE = _FACTOR_INDEX['waste.limited_landfill_space']
+_F_MARINE_DEBRIS = _FACTOR_INDEX['waste.marine_debris_impact']
+_F_TOURISM_WASTE = _FACTOR_INDEX['waste.tourism_waste_factor']
+_F_IMPORT_DEPENDENCY = _FACTOR_INDEX['food.import_dependency']
+_F_AGRICULTURE_CAPACITY = _FACTOR_INDEX['food.local_agriculture_capacity']
+_F_TOURIST_DINING = _FACTOR_INDEX['food.tourist_dining_impact']
+_F_REEF_VULNERABILITY = _FACTOR_INDEX['activities.reef_vulnerability']
+_F_WILDLIFE_DISTURBANCE = _FACTOR_INDEX['activities.wildlife_disturbance']
+_F_ISLAND_MULTIPLIER = _FACTOR_INDEX['carbon.island_multiplier']
+_F_FLIGHT_EMISSIONS = _FACTOR_INDEX['carbon.flight_emissions_factor']
+
+# Oahu-specific educational resources; static content shared across reruns
+_OAHU_RESOURCES = {
+    "Sustainable Accommodations": [
+        {
+            "name": "Hawaii Green Business Program",
+            "description": "Directory of hotels and accommodations certified for their sustainable practices in Hawaii.",
+            "url": "https://greenbusiness.hawaii.gov/"
         },
-        'accommodation': {
-            'hotel_energy_intensity': 20.5,    # kWh per guest night
-            'resort_water_intensity': 300,     # Gallons per guest night
-            'green_certified_percentage': 0.25, # Percentage of accommodations with green certification
-            'avg_ac_usage': 8                  # Average hours of AC use per day
+        {
+            "name": "Green Hotels Association",
+            "description": "Information on eco-friendly accommodations and sustainable hotel practices in Hawaii.",
+            "url": "https://www.greenhotels.com/"
+        }
+    ],
+    "Responsible Transportation": [
+        {
+            "name": "Biki Bikeshare",
+            "description": "Honolulu's bikeshare program offering an eco-friendly way to explore urban Oahu.",
+            "url": "https://gobiki.org/"
         },
-        'energy': {
-            'electricity_cost': 0.34,          # $ per kWh (highest in the US)
-            'renewable_percentage': 0.35,      # Percentage of grid from renewables
-            'fossil_fuel_dependency': 0.65,    # Dependency on imported fossil fuels
-            'tourism_energy_factor': 1.5       # Tourist energy use vs. resident (multiplier)
+        {
+            "name": "TheBus - Oahu Transit Services",
+            "description": "Information about Honolulu's public bus system routes and schedules for tourists.",
+            "url": "http://www.thebus.org/"
         },
-        'water': {
-            'freshwater_scarcity': 0.7,        # Higher means more scarce
-            'rainfall_variation': 0.7,         # Geographic rainfall variation
-            'tourism_water_factor': 2.0,       # Tourist water use vs. resident (multiplier)
-            'avg_hotel_consumption': 300       # Average per guest daily consumption (gallons)
+        {
+            "name": "Sustainable Transportation Guide",
+            "description": "Guide to low-impact transportation options around the island.",
+            "url": "https://www.gohawaii.com/islands/oahu/travel-tips"
+        }
+    ],
+    "Eco-Friendly Activities": [
+        {
+            "name": "Hawaii Ecotourism Association",
+            "description": "Directory of certified tour operators committed to sustainable practices in Hawaii.",
+            "url": "https://www.hawaiiecotourism.org/"
         },
-        'waste': {
-            'limited_landfill_space': 0.8,     # Limited landfill capacity
-            'recycling_infrastructure': 0.5,   # Quality of recycling infrastructure
-            'marine_debris_impact': 0.9,       # Impact of waste on marine environment
-            'tourism_waste_factor': 1.8        # Tourist waste vs. resident (multiplier)
+        {
+            "name": "Sustainable Coastlines Hawaii",
+            "description": "Organizes beach cleanups that tourists can join and provides education about marine conservation.",
+            "url": "https://www.sustainablecoastlineshawaii.org/"
         },
-        'food': {
-            'import_dependency': 0.85,         # Percentage of food imported
-            'local_agriculture_capacity': 0.3, # Capacity for local agriculture
-            'fishing_sustainability': 0.6,     # Sustainability of local fishing
-            'tourist_dining_impact': 1.6       # Tourist dining impact vs. resident (multiplier)
+        {
+            "name": "Hawaii Wildlife Fund",
+            "description": "Information on responsible wildlife viewing and conservation efforts tourists can support.",
+            "url": "https://www.wildhawaii.org/"
+        }
+    ],
+    "Responsible Dining": [
+        {
+            "name": "Slow Food Oahu",
+            "description": "Guide to restaurants and markets featuring local, sustainable food options.",
+            "url": "https://www.slowfoodoahu.org/"
         },
-        'activities': {
-            'reef_vulnerability': 0.8,         # Vulnerability of coral reefs
-            'trail_erosion_factor': 0.7,       # Impact of hiking on trails
-            'wildlife_disturbance': 0.6,       # Impact on local wildlife
-            'marine_activity_impact': 0.75     # Impact of water activities on marine ecosystems
+        {
+            "name": "Hawaii Farm Bureau",
+            "description": "Information on farmers markets where tourists can purchase local produce.",
+            "url": "https://hfbf.org/"
         },
-        'carbon': {
-            'island_multiplier': 1.2,          # Island context multiplier for carbon emissions
-            'tourism_impact': 1.5,             # Impact of tourism activities on carbon emissions
-            'flight_emissions_factor': 0.2,    # Tons CO2 per 1000 miles flown
-            'avg_tourist_emissions': 3.2       # Average carbon footprint (tons/tourist/week)
+        {
+            "name": "Seafood Watch Hawaii",
+            "description": "Guide to sustainable seafood choices specific to Hawaii.",
+            "url": "https://www.seafoodwatch.org/"
         }
-    }
-    
-    return factors
-
-def get_oahu_tourist_resources():
-    """
-    Return a dictionary of Oahu-specific educational resources
-    related to sustainable tourism.
-    """
-    resources = {
-        "Sustainable Accommodations": [
-            {
-                "name": "Hawaii Green Business Program",
-                "description": "Directory of hotels and accommodations certified for their sustainable practices in Hawaii.",
-                "url": "https://greenbusiness.hawaii.gov/"
-            },
-            {
-                "name": "Green Hotels Association",
-                "description": "Information on eco-friendly accommodations and sustainable hotel practices in Hawaii.",
-                "url": "https://www.greenhotels.com/"
-            }
-        ],
-        "Responsible Transportation": [
-            {
-                "name": "Biki Bikeshare",
-                "description": "Honolulu's bikeshare program offering an eco-friendly way to explore urban Oahu.",
-                "url": "https://gobiki.org/"
-            },
-            {
-                "name": "TheBus - Oahu Transit Services",
-                "description": "Information about Honolulu's public bus system routes and schedules for tourists.",
-                "url": "http://www.thebus.org/"
-            },
-            {
-                "name": "Sustainable Transportation Guide",
-                "description": "Guide to low-impact transportation options around the island.",
-                "url": "https://www.gohawaii.com/islands/oahu/travel-tips"
-            }
-        ],
-        "Eco-Friendly Activities": [
-            {
-                "name": "Hawaii Ecotourism Association",
-                "description": "Directory of certified tour operators committed to sustainable practices in Hawaii.",
-                "url": "https://www.hawaiiecotourism.org/"
-            },
-            {
-                "name": "Sustainable Coastlines Hawaii",
-                "description": "Organizes beach cleanups that tourists can join and provides education about marine conservation.",
-                "url": "https://www.sustainablecoastlineshawaii.org/"
-            },
-            {
-                "name": "Hawaii Wildlife Fund",
-                "description": "Information on responsible wildlife viewing and conservation efforts tourists can support.",
-                "url": "https://www.wildhawaii.org/"
-            }
-        ],
-        "Responsible Dining": [
-            {
-                "name": "Slow Food Oahu",
-                "description": "Guide to restaurants and markets featuring local, sustainable food options.",
-                "url": "https://www.slowfoodoahu.org/"
-            },
-            {
-                "name": "Hawaii Farm Bureau",
-                "description": "Information on farmers markets where tourists can purchase local produce.",
-                "url": "https://hfbf.org/"
-            },
-            {
-                "name": "Seafood Watch Hawaii",
-                "description": "Guide to sustainable seafood choices specific to Hawaii.",
-                "url": "https://www.seafoodwatch.org/"
-            }
-        ],
-        "Conservation Programs": [
-            {
-                "name": "Malama Hawaii Program",
-                "description": "Volunteer opportunities for tourists to give back through conservation activities during their stay.",
-                "url": "https://www.gohawaii.com/malama"
-            },
-            {
-                "name": "Hawaii Conservation Alliance",
-                "description": "Information on protected areas and conservation efforts tourists can support.",
-                "url": "https://www.hawaiiconservation.org/"
-            },
-            {
-                "name": "Coral Reef Alliance Hawaii",
-                "description": "Educational resources on protecting Hawaii's coral reefs during tourist activities.",
-                "url": "https://coral.org/where-we-work/hawaii/"
-            }
-        ],
-        "Cultural Sustainability": [
-            {
-                "name": "Hawaii Tourism Authority - Responsible Tourism",
-                "description": "Guidelines for respectful and sustainable tourism that honors Hawaiian culture.",
-                "url": "https://www.hawaiitourismauthority.org/responsible-tourism/"
-            },
-            {
-                "name": "Native Hawaiian Hospitality Association",
-                "description": "Resources on culturally responsible tourism practices.",
-                "url": "https://www.nahha.com/"
-            }
-        ],
-        "Zero Waste Travel": [
-            {
-                "name": "Zero Waste Oahu",
-                "description": "Tips and locations for reducing waste during your vacation on Oahu.",
-                "url": "https://www.zerowasteoahu.org/"
-            },
-            {
-                "name": "Kokua Hawaii Foundation",
-                "description": "Educational resources on reducing plastic use during beach and ocean activities.",
-                "url": "https://kokuahawaiifoundation.org/"
-            }
-        ]
-    }
-    
-    return resources
+    ],
+    "Conservation Programs": [
+        {
+            "name": "Malama Hawaii Program",
+            "description": "Volunteer opportunities for tourists to give back through conservation activities during their stay.",
+            "url": "https://www.gohawaii.com/malama"
+        },
+        {
+            "name": "Hawaii Conservation Alliance",
+            "description": "Information on protected areas and conservation efforts tourists can support.",
+            "url": "https://www.hawaiiconservation.org/"
+        },
+        {
+            "name": "Coral Reef Alliance Hawaii",
+            "description": "Educational resources on protecting Hawaii's coral reefs during tourist activities.",
+            "url": "https://coral.org/where-we-work/hawaii/"
+        }
+    ],
+    "Cultural Sustainability": [
+        {
+            "name": "Hawaii Tourism Authority - Responsible Tourism",
+            "description": "Guidelines for respectful and sustainable tourism that honors Hawaiian culture.",
+            "url": "https://www.hawaiitourismauthority.org/responsible-tourism/"
+        },
+        {
+            "name": "Native Hawaiian Hospitality Association",
+            "description": "Resources on culturally responsible tourism practices.",
+            "url": "https://www.nahha.com/"
+        }
+    ],
+    "Zero Waste Travel": [
+        {
+            "name": "Zero Waste Oahu",
+            "description": "Tips and locations for reducing waste during your vacation on Oahu.",
+            "url": "https://www.zerowasteoahu.org/"
+        },
+        {
+            "name": "Kokua Hawaii Foundation",
+            "description": "Educational resources on reducing plastic use during beach and ocean activities.",
+            "url": "https://kokuahawaiifoundation.org/"
+        }
+    ]
+}
 
 #############################
 # TOURIST SUSTAINABILITY CALCULATOR
 #############################
 
+@dataclass(slots=True, frozen=True)
+class UserData:
+    """Trip details collected by input_form; percentages are stored as 0-1 fractions"""
+    duration: int
+    flight_distance: int
+    local_transport: str
+    accommodation_type: str
+    ac_usage: int
+    water_conservation: float
+    linen_reuse: bool
+    reusable_bottle: bool
+    reusable_bag: bool
+    refuse_single_use: float
+    cleanup_participation: bool
+    plant_based: float
+    local_food: float
+    seafood_sustainable: bool
+    food_waste: float
+    shower_length: int
+    pool_usage: int
+    activities: frozenset
+    reef_safe: bool
+    wildlife_distance: bool
+    eco_tours: bool
+
+_USER_DATA_FIELDS = tuple(field.name for field in fields(UserData))
+
+# Category weights for the overall score (weighted average), aligned with _SCORE_KEYS
+_SCORE_KEYS = ('transport', 'accommodation', 'activities', 'water', 'waste', 'food')
+_SCORE_WEIGHTS = np.array([0.2, 0.2, 0.15, 0.15, 0.15, 0.15])
+
+# Layout of the encoded feature vector consumed by the numeric kernels
+_FEATURE_NAMES = (
+    'duration', 'flight_distance', 'ac_usage', 'water_conservation', 'shower_length', 'pool_usage',
+    'refuse_single_use', 'local_food', 'plant_based', 'food_waste'
+)
+_FEATURE_INDEX = {name: i for i, name in enumerate(_FEATURE_NAMES)}
+
+# Offsets into the feature vector
+_FEAT_DURATION = _FEATURE_INDEX['duration']
+_FEAT_FLIGHT_DISTANCE = _FEATURE_INDEX['flight_distance']
+_FEAT_AC_USAGE = _FEATURE_INDEX['ac_usage']
+_FEAT_WATER_CONSERVATION = _FEATURE_INDEX['water_conservation']
+_FEAT_SHOWER_LENGTH = _FEATURE_INDEX['shower_length']
+_FEAT_POOL_USAGE = _FEATURE_INDEX['pool_usage']
+_FEAT_REFUSE_SINGLE_USE = _FEATURE_INDEX['refuse_single_use']
+_FEAT_LOCAL_FOOD = _FEATURE_INDEX['local_food']
+_FEAT_PLANT_BASED = _FEATURE_INDEX['plant_based']
+_FEAT_FOOD_WASTE = _FEATURE_INDEX['food_waste']
+
+# Yes/no choices and their score adjustments: a bonus when the flag is set and a
+# penalty when it is not. One row per score in _SCORE_KEYS, one column per flag
+_FLAG_NAMES = (
+    'linen_reuse', 'eco_tours', 'wildlife_distance', 'reef_safe',
+    'reusable_bottle', 'reusable_bag', 'cleanup_participation', 'seafood_sustainable'
+)
+_FLAG_INDEX = {name: i for i, name in enumerate(_FLAG_NAMES)}
+
+# Offsets into the flag vector
+_FLAG_LINEN_REUSE = _FLAG_INDEX['linen_reuse']
+_FLAG_WILDLIFE_DISTANCE = _FLAG_INDEX['wildlife_distance']
+_FLAG_REEF_SAFE = _FLAG_INDEX['reef_safe']
+_FLAG_REUSABLE_BOTTLE = _FLAG_INDEX['reusable_bottle']
+_FLAG_REUSABLE_BAG = _FLAG_INDEX['reusable_bag']
+_FLAG_CLEANUP_PARTICIPATION = _FLAG_INDEX['cleanup_participation']
+
+_FLAG_BONUS = np.array([
+    # linen eco wildlife reef bottle bag cleanup seafood
+    [0, 0, 0, 0, 0, 0, 0, 0],       # transport
+    [10, 0, 0, 0, 0, 0, 0, 0],      # accommodation
+    [0, 15, 10, 15, 0, 0, 0, 0],    # activities
+    [15, 0, 0, 0, 0, 0, 0, 0],      # water
+    [0, 0, 0, 0, 15, 10, 20, 0],    # waste
+    [0, 0, 0, 0, 0, 0, 0, 15]       # food
+], dtype=float)
+_FLAG_PENALTY = np.array([
+    # linen eco wildlife reef bottle bag cleanup seafood
+    [0, 0, 0, 0, 0, 0, 0, 0],       # transport
+    [0, 0, 0, 0, 0, 0, 0, 0],       # accommodation
+    [0, 0, 10, 15, 0, 0, 0, 0],     # activities
+    [10, 0, 0, 0, 0, 0, 0, 0],      # water
+    [0, 0, 0, 0, 15, 10, 0, 0],     # waste
+    [0, 0, 0, 0, 0, 0, 0, 15]       # food
+], dtype=float)
+# Flags whose penalty is scaled by an Oahu factor, and the offsets of those factors;
+# every other flag's penalty is unscaled
+_SCALED_PENALTY_FLAGS = np.array([_FLAG_WILDLIFE_DISTANCE, _FLAG_REEF_SAFE])
+_SCALED_PENALTY_FACTOR_OFFSETS = np.array([_F_WILDLIFE_DISTURBANCE, _F_REEF_VULNERABILITY])
+
+# Local transport choices: (impact multiplier, carbon factor in tons CO2 per mile)
+# Lower multipliers are better - less emissions
+_LOCAL_TRANSPORT_TABLE = {
+    "Rental EV": (0.3, 0.0001),
+    "Rental hybrid": (0.6, 0.0002),
+    "Rental economy car": (1.0, 0.0004),
+    "Rental SUV/large vehicle": (2.0, 0.0007),
+    "Public transportation/shuttle": (0.4, 0.0001),
+    "Mostly walking/biking": (0.1, 0.00001),
+    "Rideshare/taxi": (0.8, 0.0003)
+}
+
+# Accommodation choices: (impact multiplier, carbon factor in tons CO2 per night,
+# water factor in gallons per person per day). Lower multipliers are better - less impact
+_ACCOMMODATION_TABLE = {
+    "Eco-certified hotel/resort": (0.5, 0.01, 80),
+    "Standard hotel/resort": (1.0, 0.03, 150),
+    "Luxury resort": (1.5, 0.06, 250),
+    "Vacation rental": (0.8, 0.02, 100),
+    "Hostel/budget accommodation": (0.6, 0.01, 70),
+    "Camping/outdoor lodging": (0.3, 0.005, 30)
+}
+
+# Choices are resolved to an index once, then used to read the parallel arrays below
+_LOCAL_TRANSPORT_CHOICES = tuple(_LOCAL_TRANSPORT_TABLE)
+_LOCAL_TRANSPORT_IDX = {name: i for i, name in enumerate(_LOCAL_TRANSPORT_CHOICES)}
+_TRANSPORT_MULTIPLIERS, _TRANSPORT_CARBON = np.array(list(_LOCAL_TRANSPORT_TABLE.values())).T
+
+# Walking/biking and public transport benefit from Oahu's public transport quality,
+# EV rentals are held back by limited EV availability
+_SHARED_TRANSPORT = np.array([
+    name in ("Public transportation/shuttle", "Mostly walking/biking") for name in _LOCAL_TRANSPORT_CHOICES
+], dtype=float)
+_RENTAL_EV = np.array([name == "Rental EV" for name in _LOCAL_TRANSPORT_CHOICES], dtype=float)
+
+_ACCOMMODATION_CHOICES = tuple(_ACCOMMODATION_TABLE)
+_ACCOMMODATION_IDX = {name: i for i, name in enumerate(_ACCOMMODATION_CHOICES)}
+_ACCOMMODATION_MULTIPLIERS, _ACCOMMODATION_CARBON, _ACCOMMODATION_WATER = (
+    np.array(list(_ACCOMMODATION_TABLE.values())).T
+)
+
+# Activity impact coefficients, optionally scaled by an Oahu 'activities' factor
+_ACTIVITY_BASE = {
+    "Snorkeling/scuba on coral reefs": (15, 'reef_vulnerability'),
+    "Motorized water sports (jet ski, motorboats)": (25, None),
+    "Hiking on maintained trails": (5, 'trail_erosion_factor'),
+    "Off-trail hiking/exploration": (20, 'trail_erosion_factor'),
+    "Wildlife viewing tours": (10, 'wildlife_disturbance'),
+    "ATV/off-road vehicle tours": (30, None),
+    "Shopping/dining": (10, None),
+    "Cultural sites/museums": (5, None),
+    "Beach relaxation": (5, None),
+    "Surfing/paddleboarding": (5, 'marine_activity_impact')
+}
+
+# Selected activities are encoded as a boolean mask aligned with _ACTIVITY_NAMES
+_ACTIVITY_NAMES = tuple(_ACTIVITY_BASE)
+_ACTIVITY_COEFFICIENTS = np.array([coefficient for coefficient, _ in _ACTIVITY_BASE.values()], dtype=float)
+# Activities scaled by an Oahu factor, and the offsets of those factors; the rest are unscaled
+_SCALED_ACTIVITIES = np.array([i for i, (_, factor) in enumerate(_ACTIVITY_BASE.values()) if factor])
+_SCALED_ACTIVITY_FACTOR_OFFSETS = np.array([
+    _FACTOR_INDEX[f'activities.{factor}'] for _, factor in _ACTIVITY_BASE.values() if factor
+])
+
+# Activity carbon factors (tons CO2 per activity)
+_ACTIVITY_CARBON = {
+    "Snorkeling/scuba on coral reefs": 0.005,
+    "Motorized water sports (jet ski, motorboats)": 0.03,
+    "Hiking on maintained trails": 0.001,
+    "Off-trail hiking/exploration": 0.001,
+    "Wildlife viewing tours": 0.01,
+    "ATV/off-road vehicle tours": 0.04,
+    "Shopping/dining": 0.005,
+    "Cultural sites/museums": 0.002,
+    "Beach relaxation": 0.001,
+    "Surfing/paddleboarding": 0.001
+}
+_ACTIVITY_CARBON_ARR = np.array([_ACTIVITY_CARBON[name] for name in _ACTIVITY_NAMES])
+
+# Food emissions adjustment by share of plant-based meals:
+# mostly meat-based (< 0.3), mixed diet (< 0.7), mostly plant-based
+_PLANT_BASED_THRESHOLDS = np.array([0.3, 0.7])
+_DIET_ADJUSTMENTS = np.array([2.0, 1.5, 0.8])
+
+# Results kept across sessions; every distinct submission adds one
+_RESULTS_CACHE_ENTRIES = 128
+
 def calculate_impact(user_data):
     """
     Calculate environmental impact based on tourist inputs and Oahu-specific factors.
     Returns dictionary with impact scores and detailed metrics.
+    Results are memoized across reruns and sessions for identical inputs.
     """
-    # Get Oahu-specific environmental factors
-    oahu_factors = get_oahu_environmental_factors()
-    
-    # Calculate transport impact
-    transport_score = calculate_transport_impact(user_data, oahu_factors)
-    
-    # Calculate accommodation impact
-    accommodation_score = calculate_accommodation_impact(user_data, oahu_factors)
-    
-    # Calculate activities impact
-    activities_score = calculate_activities_impact(user_data, oahu_factors)
-    
-    # Calculate water impact
-    water_score = calculate_water_impact(user_data, oahu_factors)
-    
-    # Calculate waste impact
-    waste_score = calculate_waste_impact(user_data, oahu_factors)
-    
-    # Calculate food impact
-    food_score = calculate_food_impact(user_data, oahu_factors)
-    
-    # Calculate carbon footprint (in tons of CO2 for the trip)
-    carbon_footprint = calculate_carbon_footprint(user_data, oahu_factors)
-    
-    # Calculate water usage (in gallons per day)
-    water_usage = calculate_water_usage(user_data, oahu_factors)
-    
-    # Calculate waste generation (in pounds per day)
-    waste_generation = calculate_waste_generation(user_data, oahu_factors)
-    
-    # Calculate overall score (weighted average)
-    weights = {
-        'transport': 0.2,
-        'accommodation': 0.2,
-        'activities': 0.15,
-        'water': 0.15,
-        'waste': 0.15,
-        'food': 0.15
-    }
-    
-    overall_score = (
-        transport_score * weights['transport'] +
-        accommodation_score * weights['accommodation'] +
-        activities_score * weights['activities'] +
-        water_score * weights['water'] +
-        waste_score * weights['waste'] +
-        food_score * weights['food']
+    return _calculate_impact_cached(user_data)
+
+def _user_data_key(user_data):
+    """Return a value key for user_data, with activities sorted so equal selections hash alike"""
+    return tuple(
+        tuple(sorted(value)) if isinstance(value, frozenset) else value
+        for value in (getattr(user_data, name) for name in _USER_DATA_FIELDS)
+    )
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES, hash_funcs={UserData: _user_data_key})
+def _calculate_impact_cached(user_data):
+    """Calculate environmental impact for user_data; see calculate_impact"""
+    # Read user_data once, then compute every score and metric from the encoded inputs
+    scores, carbon_footprint, water_usage, waste_generation = _compute_all(
+        *_encode_user_data(user_data), _FACTORS
     )
     
-    # Round to nearest integer
-    overall_score = round(overall_score)
+    # Calculate overall score (weighted average), rounded to nearest integer
+    weighted_scores = _SCORE_WEIGHTS * scores
+    overall_score = round(float(weighted_scores.sum()))
+    
+    # Share of the overall score contributed by each category
+    if overall_score > 0:
+        breakdown = weighted_scores / overall_score
+    else:
+        breakdown = np.zeros(len(_SCORE_KEYS))
     
     # Compile results
-    results = {
-        'overall_score': overall_score,
-        'transport_score': transport_score,
-        'accommodation_score': accommodation_score,
-        'activities_score': activities_score,
-        'water_score': water_score,
-        'waste_score': waste_score,
-        'food_score': food_score,
+    results = {'overall_score': overall_score}
+    results.update((f'{key}_score', score) for key, score in zip(_SCORE_KEYS, scores.tolist()))
+    results.update({
         'carbon_footprint': carbon_footprint,
         'water_usage': water_usage,
         'waste_generation': waste_generation,
-        'impact_breakdown': {
-            'transport': weights['transport'] * transport_score / overall_score if overall_score > 0 else 0,
-            'accommodation': weights['accommodation'] * accommodation_score / overall_score if overall_score > 0 else 0,
-            'activities': weights['activities'] * activities_score / overall_score if overall_score > 0 else 0,
-            'water': weights['water'] * water_score / overall_score if overall_score > 0 else 0,
-            'waste': weights['waste'] * waste_score / overall_score if overall_score > 0 else 0,
-            'food': weights['food'] * food_score / overall_score if overall_score > 0 else 0
-        }
-    }
+        'impact_breakdown': dict(zip(_SCORE_KEYS, breakdown.tolist())),
+        # Display strings, formatted once here rather than on every render
+        'carbon_footprint_text': format_carbon(carbon_footprint),
+        'water_usage_text': f"{format_water(water_usage)} per day",
+        'waste_generation_text': f"{waste_generation} lbs per day"
+    })
     
     return results
 
-def calculate_transport_impact(user_data, oahu_factors):
-    """Calculate transport-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Flight impact - longer flights = more emissions
-    flight_distance = user_data['flight_distance']
-    flight_impact = flight_distance * 0.02  # More miles = bigger impact
-    base_score -= flight_impact
-    
-    # Local transport impacts
-    local_transport = user_data['local_transport']
-    
-    # Transport type multipliers (lower is better - less emissions)
-    transport_multipliers = {
-        "Rental EV": 0.3,
-        "Rental hybrid": 0.6,
-        "Rental economy car": 1.0,
-        "Rental SUV/large vehicle": 2.0,
-        "Public transportation/shuttle": 0.4,
-        "Mostly walking/biking": 0.1,
-        "Rideshare/taxi": 0.8
-    }
-    
-    # Calculate local transport impact
-    daily_miles = oahu_factors['transport']['avg_tourist_travel_distance']
-    transport_impact = daily_miles * transport_multipliers[local_transport] * 0.15
-    base_score -= transport_impact
-    
-    # Adjust for Oahu-specific factors
-    if local_transport in ["Public transportation/shuttle", "Mostly walking/biking"]:
-        # Public transport quality factor (higher quality = better score)
-        base_score += 10 * oahu_factors['transport']['public_transport_quality']
-    elif local_transport == "Rental EV":
-        # EV rental availability factor (lower availability = decreased score)
-        base_score -= 5 * (1 - oahu_factors['transport']['ev_rental_availability'])
-    
-    # Tourism-specific congestion impact
-    congestion_impact = 5 * oahu_factors['transport']['traffic_congestion_factor']
-    base_score -= congestion_impact
-    
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
-
-def calculate_accommodation_impact(user_data, oahu_factors):
-    """Calculate accommodation-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Accommodation type has different baseline impacts
-    accommodation_type = user_data['accommodation_type']
-    
-    # Accommodation impact multipliers (lower is better - less impact)
-    accommodation_multipliers = {
-        "Eco-certified hotel/resort": 0.5,
-        "Standard hotel/resort": 1.0,
-        "Luxury resort": 1.5,
-        "Vacation rental": 0.8,
-        "Hostel/budget accommodation": 0.6,
-        "Camping/outdoor lodging": 0.3
-    }
-    
-    # Base impact from accommodation type
-    accommodation_impact = 30 * accommodation_multipliers[accommodation_type]
-    base_score -= accommodation_impact
-    
-    # AC usage impact
-    ac_usage = user_data['ac_usage']
-    ac_impact = ac_usage * 2  # More hours = bigger impact
-    base_score -= ac_impact
-    
-    # Water conservation practices
-    water_conservation = user_data['water_conservation']
-    water_practices_impact = 15 * (1 - water_conservation)  # Higher conservation = less impact
-    base_score -= water_practices_impact
-    
-    # Linen reuse
-    linen_reuse = user_data['linen_reuse']
-    if linen_reuse:
-        base_score += 10
-    
-    # Adjust for Oahu-specific factors
-    energy_factor = oahu_factors['energy']['tourism_energy_factor']
-    base_score -= 5 * (energy_factor - 1)  # Adjust for higher tourist energy use
-    
-    # Green certification percentage factor
-    green_cert_adjustment = 5 * oahu_factors['accommodation']['green_certified_percentage']
-    base_score += green_cert_adjustment
-    
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
-
-def calculate_activities_impact(user_data, oahu_factors):
-    """Calculate activities-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Activity types
-    activities = user_data['activities']
-    
-    # Activity impact multipliers (lower is better - less impact)
-    activity_impacts = {
-        "Snorkeling/scuba on coral reefs": 15 * oahu_factors['activities']['reef_vulnerability'],
-        "Motorized water sports (jet ski, motorboats)": 25,
-        "Hiking on maintained trails": 5 * oahu_factors['activities']['trail_erosion_factor'],
-        "Off-trail hiking/exploration": 20 * oahu_factors['activities']['trail_erosion_factor'],
-        "Wildlife viewing tours": 10 * oahu_factors['activities']['wildlife_disturbance'],
-        "ATV/off-road vehicle tours": 30,
-        "Shopping/dining": 10,
-        "Cultural sites/museums": 5,
-        "Beach relaxation": 5,
-        "Surfing/paddleboarding": 5 * oahu_factors['activities']['marine_activity_impact']
-    }
-    
-    # Calculate impact from selected activities
-    total_activity_impact = 0
-    for activity in activities:
-        total_activity_impact += activity_impacts.get(activity, 10)
-    
-    # Normalize by number of activities
-    if activities:
-        avg_activity_impact = total_activity_impact / len(activities)
-        base_score -= avg_activity_impact
-    
-    # Eco-tour selection
-    eco_tours = user_data['eco_tours']
-    if eco_tours:
-        base_score += 15
-    
-    # Wildlife distance
-    wildlife_distance = user_data['wildlife_distance']
-    if wildlife_distance:
-        base_score += 10
-    else:
-        base_score -= 10 * oahu_factors['activities']['wildlife_disturbance']
-    
-    # Reef-safe sunscreen
-    reef_safe = user_data['reef_safe']
-    if reef_safe:
-        base_score += 15
-    else:
-        base_score -= 15 * oahu_factors['activities']['reef_vulnerability']
-    
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
-
-def calculate_water_impact(user_data, oahu_factors):
-    """Calculate water-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Shower length has direct impact
-    shower_length = user_data['shower_length']
-    shower_impact = shower_length * 2.5  # Longer shower = bigger impact
-    base_score -= shower_impact
-    
-    # Water conservation practices at accommodation
-    water_conservation = user_data['water_conservation']
-    conservation_impact = 20 * (1 - water_conservation)  # Less conservation = bigger impact
-    base_score -= conservation_impact
-    
-    # Linen reuse reduces water impact
-    linen_reuse = user_data['linen_reuse']
-    if linen_reuse:
-        base_score += 15
-    else:
-        base_score -= 10
-    
-    # Swimming pool usage
-    pool_usage = user_data['pool_usage']
-    pool_impact = pool_usage * 3  # More pool time = bigger impact
-    base_score -= pool_impact
-    
-    # Adjust for Oahu-specific factors
-    water_scarcity = oahu_factors['water']['freshwater_scarcity']
-    scarcity_impact = 10 * water_scarcity  # Higher scarcity = bigger impact
-    base_score -= scarcity_impact
-    
-    # Tourism water factor adjustment
-    tourism_water_factor = oahu_factors['water']['tourism_water_factor']
-    base_score -= 5 * (tourism_water_factor - 1)  # Adjust for higher tourist water use
-    
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
-
-def calculate_waste_impact(user_data, oahu_factors):
-    """Calculate waste-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Reusable water bottle usage reduces waste
-    reusable_bottle = user_data['reusable_bottle']
-    if reusable_bottle:
-        base_score += 15
-    else:
-        base_score -= 15
-    
-    # Reusable bag usage reduces waste
-    reusable_bag = user_data['reusable_bag']
-    if reusable_bag:
-        base_score += 10
-    else:
-        base_score -= 10
+def _encode_user_data(user_data):
+    """
+    Encode user_data for the numeric kernels in a single pass.
+    Returns (lt_idx, acc_idx, activities_mask, flags, features).
+    """
+    return (
+        _LOCAL_TRANSPORT_IDX[user_data.local_transport],
+        _ACCOMMODATION_IDX[user_data.accommodation_type],
+        _encode_activities(user_data.activities),
+        _encode_flags(user_data),
+        _encode_features(user_data)
+    )
+
+def _compute_all(lt_idx, acc_idx, activities_mask, flags, features, factors):
+    """
+    Calculate the six category scores, carbon footprint (tons of CO2 for the trip),
+    water usage (gallons per day) and waste generation (pounds per day)
+    from the encoded user inputs and the flattened Oahu factors.
+    """
+    return (
+        _compute_scores(lt_idx, acc_idx, activities_mask, flags, features, factors),
+        calculate_carbon_footprint(lt_idx, acc_idx, activities_mask, features, factors),
+        calculate_water_usage(acc_idx, flags, features, factors),
+        calculate_waste_generation(flags, features, factors)
+    )
+
+def _encode_activities(activities):
+    """Return a boolean mask of the selected activities, aligned with _ACTIVITY_NAMES"""
+    selected = set(activities)
+    return np.array([name in selected for name in _ACTIVITY_NAMES], dtype=bool)
+
+def _encode_features(user_data):
+    """Pack user inputs into the numeric feature vector laid out by _FEATURE_NAMES"""
+    return np.array([getattr(user_data, name) for name in _FEATURE_NAMES], dtype=float)
+
+def _encode_flags(user_data):
+    """Pack the user's yes/no choices into a 0/1 vector laid out by _FLAG_NAMES"""
+    return np.array([getattr(user_data, name) for name in _FLAG_NAMES], dtype=float)
+
+def _compute_scores(lt_idx, acc_idx, activities_mask, flags, features, factors):
+    """
+    Calculate the six environmental impact scores (0-100) from the local transport
+    and accommodation indices, the selected activities mask, the yes/no flags,
+    an encoded feature vector and the flattened Oahu factors.
+    Returns an array aligned with _SCORE_KEYS; higher score = more sustainable.
+    """
+    flight_distance = features[_FEAT_FLIGHT_DISTANCE]
+    ac_usage = features[_FEAT_AC_USAGE]
+    water_conservation = features[_FEAT_WATER_CONSERVATION]
+    shower_length = features[_FEAT_SHOWER_LENGTH]
+    pool_usage = features[_FEAT_POOL_USAGE]
+    refuse_single_use = features[_FEAT_REFUSE_SINGLE_USE]
+    local_food = features[_FEAT_LOCAL_FOOD]
+    plant_based = features[_FEAT_PLANT_BASED]
+    food_waste = features[_FEAT_FOOD_WASTE]
+    
+    # Transport: flight and local travel emissions, adjusted for public transport
+    # quality (walking/transit), EV rental availability and congestion
+    transport_score = (
+        100
+        - flight_distance * 0.02
+        - factors[_F_TRAVEL_DISTANCE] * _TRANSPORT_MULTIPLIERS[lt_idx] * 0.15
+        + _SHARED_TRANSPORT[lt_idx] * 10 * factors[_F_PUBLIC_TRANSPORT_QUALITY]
+        - _RENTAL_EV[lt_idx] * 5 * (1 - factors[_F_EV_AVAILABILITY])
+        - 5 * factors[_F_TRAFFIC_CONGESTION]
+    )
     
-    # Refuse single-use items reduces waste
-    refuse_single_use = user_data['refuse_single_use']
-    single_use_impact = 20 * (1 - refuse_single_use)  # Less refusal = bigger impact
-    base_score -= single_use_impact
+    # Accommodation: type, AC hours, water conservation,
+    # tourist energy use and green certification
+    accommodation_score = (
+        100
+        - 30 * _ACCOMMODATION_MULTIPLIERS[acc_idx]
+        - ac_usage * 2
+        - 15 * (1 - water_conservation)
+        - 5 * (factors[_F_TOURISM_ENERGY] - 1)
+        + 5 * factors[_F_GREEN_CERTIFIED]
+    )
     
-    # Beach/trail cleanup participation
-    cleanup_participation = user_data['cleanup_participation']
-    if cleanup_participation:
-        base_score += 20
-    
-    # Adjust for Oahu-specific factors
-    landfill_factor = oahu_factors['waste']['limited_landfill_space']
-    landfill_impact = 10 * landfill_factor  # More limited space = bigger impact
-    base_score -= landfill_impact
-    
-    # Marine debris impact
-    marine_factor = oahu_factors['waste']['marine_debris_impact']
-    marine_impact = 10 * marine_factor  # Higher marine impact = bigger impact
-    base_score -= marine_impact
-    
-    # Tourism waste factor adjustment
-    tourism_waste_factor = oahu_factors['waste']['tourism_waste_factor']
-    base_score -= 5 * (tourism_waste_factor - 1)  # Adjust for higher tourist waste generation
-    
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
-
-def calculate_food_impact(user_data, oahu_factors):
-    """Calculate food-related environmental impact score (0-100)"""
-    # Higher score = more sustainable
-    base_score = 100
-    
-    # Local food consumption reduces impact
-    local_food = user_data['local_food']
-    local_food_impact = 25 * (1 - local_food)  # Less local food = bigger impact
-    base_score -= local_food_impact
-    
-    # Plant-based meals reduce impact
-    plant_based = user_data['plant_based']
-    plant_based_impact = 20 * (1 - plant_based)  # Fewer plant-based meals = bigger impact
-    base_score -= plant_based_impact
-    
-    # Seafood sustainability
-    seafood_sustainable = user_data['seafood_sustainable']
-    if seafood_sustainable:
-        base_score += 15
+    # Average impact of the selected activities (lower is better - less impact)
+    activity_scale = np.ones(len(_ACTIVITY_NAMES))
+    activity_scale[_SCALED_ACTIVITIES] = factors[_SCALED_ACTIVITY_FACTOR_OFFSETS]
+    selected_count = activities_mask.sum()
+    if selected_count:
+        activity_impact = (_ACTIVITY_COEFFICIENTS * activity_scale * activities_mask).sum() / selected_count
     else:
-        base_score -= 15
+        activity_impact = 0
+    
+    # Activities: average activity impact
+    activities_score = 100 - activity_impact
+    
+    # Water: showers, conservation, pool time, scarcity and tourist water use
+    water_score = (
+        100
+        - shower_length * 2.5
+        - 20 * (1 - water_conservation)
+        - pool_usage * 3
+        - 10 * factors[_F_FRESHWATER_SCARCITY]
+        - 5 * (factors[_F_TOURISM_WATER] - 1)
+    )
     
-    # Food waste reduction
-    food_waste = user_data['food_waste']
-    food_waste_impact = 15 * (1 - food_waste)  # Less reduction = bigger impact
-    base_score -= food_waste_impact
+    # Waste: single-use refusal, landfill, marine debris and tourist waste
+    waste_score = (
+        100
+        - 20 * (1 - refuse_single_use)
+        - 10 * factors[_F_LANDFILL_SPACE]
+        - 10 * factors[_F_MARINE_DEBRIS]
+        - 5 * (factors[_F_TOURISM_WASTE] - 1)
+    )
     
-    # Adjust for Oahu-specific factors
-    import_dependency = oahu_factors['food']['import_dependency']
-    import_impact = 10 * import_dependency  # Higher import dependency = bigger impact
-    base_score -= import_impact
+    # Food: local and plant-based meals, food waste, imports,
+    # local agriculture and tourist dining
+    food_score = (
+        100
+        - 25 * (1 - local_food)
+        - 20 * (1 - plant_based)
+        - 15 * (1 - food_waste)
+        - 10 * factors[_F_IMPORT_DEPENDENCY]
+        - 10 * (1 - factors[_F_AGRICULTURE_CAPACITY])
+        - 5 * (factors[_F_TOURIST_DINING] - 1)
+    )
     
-    # Local agriculture capacity
-    ag_capacity = oahu_factors['food']['local_agriculture_capacity']
-    ag_impact = 10 * (1 - ag_capacity)  # Lower capacity = bigger impact
-    base_score -= ag_impact
+    # Yes/no choices (linen reuse, eco-tours, wildlife distance, reef-safe sunscreen,
+    # reusables, cleanups, sustainable seafood) in one pass over the bonus table
+    penalty_scale = np.ones(len(_FLAG_NAMES))
+    penalty_scale[_SCALED_PENALTY_FLAGS] = factors[_SCALED_PENALTY_FACTOR_OFFSETS]
+    flag_adjustments = _FLAG_BONUS @ flags - (_FLAG_PENALTY * penalty_scale) @ (1 - flags)
     
-    # Tourism dining impact factor
-    tourism_food_factor = oahu_factors['food']['tourist_dining_impact']
-    base_score -= 5 * (tourism_food_factor - 1)  # Adjust for higher tourist food impact
+    scores = np.array([transport_score, accommodation_score, activities_score,
+                       water_score, waste_score, food_score]) + flag_adjustments
     
-    # Ensure score is within bounds
-    return max(0, min(100, base_score))
+    # Ensure scores are within bounds
+    return np.clip(scores, 0, 100)
 
-def calculate_carbon_footprint(user_data, oahu_factors):
+def calculate_carbon_footprint(lt_idx, acc_idx, activities_mask, features, factors):
     """Calculate carbon footprint (in tons of CO2) for the trip"""
-    carbon_factors = oahu_factors['carbon']
+    days = features[_FEAT_DURATION]
+    flight_distance = features[_FEAT_FLIGHT_DISTANCE]
+    local_food = features[_FEAT_LOCAL_FOOD]
+    plant_based = features[_FEAT_PLANT_BASED]
     
     # Calculate flight emissions
-    flight_distance = user_data['flight_distance']
-    flight_emissions = flight_distance * carbon_factors['flight_emissions_factor'] / 1000
+    flight_emissions = flight_distance * factors[_F_FLIGHT_EMISSIONS] / 1000
     
     # Calculate local transport emissions
-    local_transport = user_data['local_transport']
-    days = user_data['duration']
-    daily_miles = oahu_factors['transport']['avg_tourist_travel_distance']
-    
-    # Transport type carbon factors (tons CO2 per mile)
-    transport_carbon = {
-        "Rental EV": 0.0001,
-        "Rental hybrid": 0.0002,
-        "Rental economy car": 0.0004,
-        "Rental SUV/large vehicle": 0.0007,
-        "Public transportation/shuttle": 0.0001,
-        "Mostly walking/biking": 0.00001,
-        "Rideshare/taxi": 0.0003
-    }
+    daily_miles = factors[_F_TRAVEL_DISTANCE]
     
-    local_emissions = daily_miles * transport_carbon[local_transport] * days
+    local_emissions = daily_miles * _TRANSPORT_CARBON[lt_idx] * days
     
     # Calculate accommodation emissions
-    accommodation_type = user_data['accommodation_type']
-    
-    # Accommodation carbon factors (tons CO2 per night)
-    accommodation_carbon = {
-        "Eco-certified hotel/resort": 0.01,
-        "Standard hotel/resort": 0.03,
-        "Luxury resort": 0.06,
-        "Vacation rental": 0.02,
-        "Hostel/budget accommodation": 0.01,
-        "Camping/outdoor lodging": 0.005
-    }
-    
-    accommodation_emissions = accommodation_carbon[accommodation_type] * days
-    
-    # Calculate food emissions
-    plant_based = user_data['plant_based']
-    local_food = user_data['local_food']
+    accommodation_emissions = _ACCOMMODATION_CARBON[acc_idx] * days
     
-    # Base food emissions per day
+    # Calculate food emissions, starting from base food emissions per day
     food_emissions_base = 0.01
     
-    # Adjust for diet and local food
-    food_adjustment = 1.0
-    if plant_based < 0.3:  # Mostly meat-based
-        food_adjustment = 2.0
-    elif plant_based < 0.7:  # Mixed diet
-        food_adjustment = 1.5
-    else:  # Mostly plant-based
-        food_adjustment = 0.8
-    
-    # Local food reduces carbon footprint
-    food_adjustment *= (1.5 - local_food * 0.5)
+    # Adjust for diet (step lookup by plant-based share) and local food,
+    # which reduces carbon footprint
+    diet_band = np.searchsorted(_PLANT_BASED_THRESHOLDS, plant_based, side='right')
+    food_adjustment = _DIET_ADJUSTMENTS[diet_band] * (1.5 - local_food * 0.5)
     
     food_emissions = food_emissions_base * food_adjustment * days
     
     # Calculate activities emissions
-    activities = user_data['activities']
-    
-    # Activity carbon factors (tons CO2 per activity)
-    activity_carbon = {
-        "Snorkeling/scuba on coral reefs": 0.005,
-        "Motorized water sports (jet ski, motorboats)": 0.03,
-        "Hiking on maintained trails": 0.001,
-        "Off-trail hiking/exploration": 0.001,
-        "Wildlife viewing tours": 0.01,
-        "ATV/off-road vehicle tours": 0.04,
-        "Shopping/dining": 0.005,
-        "Cultural sites/museums": 0.002,
-        "Beach relaxation": 0.001,
-        "Surfing/paddleboarding": 0.001
-    }
-    
-    activities_emissions = sum(activity_carbon.get(activity, 0.01) for activity in activities) * (days / 3)  # Assuming not all activities every day
+    activities_emissions = float((_ACTIVITY_CARBON_ARR * activities_mask).sum()) * (days / 3)  # Assuming not all activities every day
     
     # Combine all emissions
     total_emissions = flight_emissions + local_emissions + accommodation_emissions + food_emissions + activities_emissions
     
     # Apply island context multiplier
-    total_emissions *= carbon_factors['island_multiplier']
+    total_emissions *= factors[_F_ISLAND_MULTIPLIER]
     
     return total_emissions
 
-def calculate_water_usage(user_data, oahu_factors):
+def calculate_water_usage(acc_idx, flags, features, factors):
     """Calculate water usage (in gallons per day)"""
-    water_factors = oahu_factors['water']
+    water_conservation = features[_FEAT_WATER_CONSERVATION]
+    shower_length = features[_FEAT_SHOWER_LENGTH]
+    pool_usage = features[_FEAT_POOL_USAGE]
+    linen_reuse = flags[_FLAG_LINEN_REUSE]
     
     # Base water usage from accommodation type
-    accommodation_type = user_data['accommodation_type']
-    
-    # Accommodation water factors (gallons per person per day)
-    accommodation_water = {
-        "Eco-certified hotel/resort": 80,
-        "Standard hotel/resort": 150,
-        "Luxury resort": 250,
-        "Vacation rental": 100,
-        "Hostel/budget accommodation": 70,
-        "Camping/outdoor lodging": 30
-    }
-    
-    base_water = accommodation_water[accommodation_type]
+    base_water = _ACCOMMODATION_WATER[acc_idx]
     
     # Shower water usage
-    shower_length = user_data['shower_length']
     shower_water = shower_length * 2.5 * 10  # 2.5 gallons per minute * minutes
     
     # Pool usage water impact
-    pool_usage = user_data['pool_usage']
     pool_water = pool_usage * 15  # Estimated gallons per hour of pool time
     
     # Water conservation practices
-    water_conservation = user_data['water_conservation']
     conservation_factor = 1 - (water_conservation * 0.3)  # Up to 30% reduction
     
     # Linen reuse water savings
-    linen_reuse = user_data['linen_reuse']
     linen_factor = 0.9 if linen_reuse else 1.0  # 10% savings if reusing linens
     
     # Calculate total water usage
     total_water = (base_water + shower_water + pool_water) * conservation_factor * linen_factor
     
     # Apply tourism water factor
-    total_water *= water_factors['tourism_water_factor']
+    total_water *= factors[_F_TOURISM_WATER]
     
     return round(total_water)
 
-def calculate_waste_generation(user_data, oahu_factors):
+def calculate_waste_generation(flags, features, factors):
     """Calculate waste generation (in pounds per day)"""
-    waste_factors = oahu_factors['waste']
+    refuse_single_use = features[_FEAT_REFUSE_SINGLE_USE]
+    food_waste = features[_FEAT_FOOD_WASTE]
+    reusable_bottle = flags[_FLAG_REUSABLE_BOTTLE]
+    reusable_bag = flags[_FLAG_REUSABLE_BAG]
+    cleanup_participation = flags[_FLAG_CLEANUP_PARTICIPATION]
     
     # Base waste from tourist activities
     base_waste = 4.0  # Pounds per day (EPA average)
     
     # Adjust for reusable items
-    reusable_bottle = user_data['reusable_bottle']
     bottle_factor = 0.8 if reusable_bottle else 1.2  # 20% reduction or 20% increase
     
-    reusable_bag = user_data['reusable_bag']
     bag_factor = 0.9 if reusable_bag else 1.1  # 10% reduction or 10% increase
     
     # Single-use items refusal
-    refuse_single_use = user_data['refuse_single_use']
     single_use_factor = 1 - (refuse_single_use * 0.4)  # Up to 40% reduction
     
     # Beach/trail cleanup participation
-    cleanup_participation = user_data['cleanup_participation']
     cleanup_factor = 0.9 if cleanup_participation else 1.0  # 10% reduction if participating
     
     # Food waste reduction
-    food_waste = user_data['food_waste']
     food_waste_factor = 1 - (food_waste * 0.3)  # Up to 30% reduction
     
     # Calculate total waste generation
     total_waste = base_waste * bottle_factor * bag_factor * single_use_factor * cleanup_factor * food_waste_factor
     
     # Apply tourism waste factor
-    total_waste *= waste_factors['tourism_waste_factor']
+    total_waste *= factors[_F_TOURISM_WASTE]
     
     return round(total_waste, 1)
 
-def get_recommendations(user_data, results):
-    """Generate personalized sustainability recommendations based on user data and results"""
-    recommendations = []
-    
+# Local transport and accommodation choices that trigger recommendations
+_RENTAL_CARS = frozenset({"Rental SUV/large vehicle", "Rental economy car"})
+_FULL_SERVICE_ACCOMMODATIONS = frozenset({"Standard hotel/resort", "Luxury resort"})
+_LOW_IMPACT_TRIGGERS = frozenset({"Motorized water sports (jet ski, motorboats)", "ATV/off-road vehicle tours"})
+
+# Recommendation records, shared read-only across calls
+_REC_SUSTAINABLE_TRANSPORT = MappingProxyType({
+    "category": Category.TRANSPORTATION,
+    "title": "Consider sustainable transportation",
+    "description": "Opt for Oahu's reliable public bus system (TheBus) or the Waikiki Trolley for getting around tourist areas. You can also rent bikes or use the Biki bikeshare system in Honolulu."
+})
+_REC_OFFSET_FLIGHT = MappingProxyType({
+    "category": Category.TRANSPORTATION,
+    "title": "Offset your flight emissions",
+    "description": "Consider purchasing carbon offsets for your long-distance flight to Hawaii. Many airlines offer this option, or you can use services like Cool Effect or Sustainable Travel International."
+})
+_REC_REDUCE_AC = MappingProxyType({
+    "category": Category.ACCOMMODATION,
+    "title": "Reduce AC usage",
+    "description": "Hawaii's natural trade winds provide excellent ventilation. Try using ceiling fans and opening windows instead of running AC constantly. When using AC, set it to 76-78°F (24-26°C)."
+})
+_REC_REUSE_LINENS = MappingProxyType({
+    "category": Category.ACCOMMODATION,
+    "title": "Reuse hotel towels and linens",
+    "description": "Let your hotel know you don't need daily linen changes. This saves water and energy, which are both precious resources on an island."
+})
+_REC_SHORTER_SHOWERS = MappingProxyType({
+    "category": Category.WATER,
+    "title": "Take shorter showers",
+    "description": "Fresh water is a limited resource on Oahu. Try to limit showers to 5 minutes or less, especially after beach activities when a quick rinse is sufficient."
+})
+_REC_POOL_OCEAN_BALANCE = MappingProxyType({
+    "category": Category.WATER,
+    "title": "Balance pool and ocean time",
+    "description": "While resort pools are enjoyable, consider spending more time in the ocean. Hawaii's beaches offer natural swimming opportunities without the water and chemical use of pools."
+})
+_REC_REUSABLE_BOTTLE = MappingProxyType({
+    "category": Category.WASTE,
+    "title": "Bring a reusable water bottle",
+    "description": "Plastic waste is a significant issue on Oahu, with limited landfill space. Carry a reusable water bottle - Hawaii tap water is clean and safe to drink."
+})
+_REC_BEACH_CLEANUP = MappingProxyType({
+    "category": Category.WASTE,
+    "title": "Join a beach cleanup",
+    "description": "Consider participating in a beach cleanup through organizations like Sustainable Coastlines Hawaii or the Surfrider Foundation. This is a great way to give back to the places you're enjoying."
+})
+_REC_LOCAL_FOOD = MappingProxyType({
+    "category": Category.FOOD,
+    "title": "Eat more local food",
+    "description": "Over 85% of Hawaii's food is imported. Support local farmers and reduce carbon emissions by choosing restaurants that serve locally-sourced ingredients, and shopping at farmers markets."
+})
+_REC_SUSTAINABLE_SEAFOOD = MappingProxyType({
+    "category": Category.FOOD,
+    "title": "Choose sustainable seafood",
+    "description": "Hawaii's marine ecosystems are fragile. When ordering seafood, ask about sustainable options or check the Seafood Watch app to make ocean-friendly choices."
+})
+_REC_LOW_IMPACT_ACTIVITIES = MappingProxyType({
+    "category": Category.ACTIVITIES,
+    "title": "Choose low-impact activities",
+    "description": "Consider eco-friendly alternatives like kayaking, paddleboarding, or electric boat tours that minimize noise pollution and marine ecosystem disruption."
+})
+_REC_REEF_SAFE_SUNSCREEN = MappingProxyType({
+    "category": Category.ACTIVITIES,
+    "title": "Use reef-safe sunscreen",
+    "description": "Hawaii has banned sunscreens containing oxybenzone and octinoxate because they damage coral reefs. Look for mineral-based sunscreens with zinc oxide or titanium dioxide."
+})
+_REC_WILDLIFE_DISTANCE = MappingProxyType({
+    "category": Category.ACTIVITIES,
+    "title": "Maintain distance from wildlife",
+    "description": "Hawaii law requires keeping at least 50 feet from sea turtles, monk seals, and other protected species. Never touch or chase wildlife - observe respectfully from a distance."
+})
+
+# Inputs the recommendation rules test, laid out as the columns of an encoded rule input vector
+_RULE_INPUT_NAMES = (
+    'rental_car', 'flight_distance', 'full_service_accommodation', 'ac_usage',
+    'linen_reuse', 'shower_length', 'pool_usage', 'reusable_bottle',
+    'cleanup_participation', 'local_food', 'seafood_sustainable',
+    'low_impact_trigger', 'reef_activity', 'reef_safe', 'wildlife_activity',
+    'wildlife_distance'
+)
+_RULE_INPUT_INDEX = {name: i for i, name in enumerate(_RULE_INPUT_NAMES)}
+
+# Recommendation rules in display order: (conditions, recommendation). A rule applies
+# when all its conditions hold; a condition (input, op, threshold) holds when
+# op(input, threshold) is true. Yes/no inputs are encoded as 1/0
+_RECOMMENDATION_RULES = (
     # Transport recommendations
-    if user_data['local_transport'] in ["Rental SUV/large vehicle", "Rental economy car"]:
-        recommendations.append({
-            "category": "transportation",
-            "title": "Consider sustainable transportation",
-            "description": "Opt for Oahu's reliable public bus system (TheBus) or the Waikiki Trolley for getting around tourist areas. You can also rent bikes or use the Biki bikeshare system in Honolulu."
-        })
-    
-    if user_data['flight_distance'] > 3000:
-        recommendations.append({
-            "category": "transportation",
-            "title": "Offset your flight emissions",
-            "description": "Consider purchasing carbon offsets for your long-distance flight to Hawaii. Many airlines offer this option, or you can use services like Cool Effect or Sustainable Travel International."
-        })
-    
+    ((('rental_car', np.equal, 1),), _REC_SUSTAINABLE_TRANSPORT),
+    ((('flight_distance', np.greater, 3000),), _REC_OFFSET_FLIGHT),
     # Accommodation recommendations
-    if user_data['accommodation_type'] in ["Standard hotel/resort", "Luxury resort"] and user_data['ac_usage'] > 6:
-        recommendations.append({
-            "category": "accommodation",
-            "title": "Reduce AC usage",
-            "description": "Hawaii's natural trade winds provide excellent ventilation. Try using ceiling fans and opening windows instead of running AC constantly. When using AC, set it to 76-78°F (24-26°C)."
-        })
-    
-    if not user_data['linen_reuse']:
-        recommendations.append({
-            "category": "accommodation",
-            "title": "Reuse hotel towels and linens",
-            "description": "Let your hotel know you don't need daily linen changes. This saves water and energy, which are both precious resources on an island."
-        })
-    
+    ((('full_service_accommodation', np.equal, 1), ('ac_usage', np.greater, 6)), _REC_REDUCE_AC),
+    ((('linen_reuse', np.equal, 0),), _REC_REUSE_LINENS),
     # Water recommendations
-    if user_data['shower_length'] > 5:
-        recommendations.append({
-            "category": "water",
-            "title": "Take shorter showers",
-            "description": "Fresh water is a limited resource on Oahu. Try to limit showers to 5 minutes or less, especially after beach activities when a quick rinse is sufficient."
-        })
-    
-    if user_data['pool_usage'] > 3:
-        recommendations.append({
-            "category": "water",
-            "title": "Balance pool and ocean time",
-            "description": "While resort pools are enjoyable, consider spending more time in the ocean. Hawaii's beaches offer natural swimming opportunities without the water and chemical use of pools."
-        })
-    
+    ((('shower_length', np.greater, 5),), _REC_SHORTER_SHOWERS),
+    ((('pool_usage', np.greater, 3),), _REC_POOL_OCEAN_BALANCE),
     # Waste recommendations
-    if not user_data['reusable_bottle']:
-        recommendations.append({
-            "category": "waste",
-            "title": "Bring a reusable water bottle",
-            "description": "Plastic waste is a significant issue on Oahu, with limited landfill space. Carry a reusable water bottle - Hawaii tap water is clean and safe to drink."
-        })
-    
-    if not user_data['cleanup_participation']:
-        recommendations.append({
-            "category": "waste",
-            "title": "Join a beach cleanup",
-            "description": "Consider participating in a beach cleanup through organizations like Sustainable Coastlines Hawaii or the Surfrider Foundation. This is a great way to give back to the places you're enjoying."
-        })
-    
+    ((('reusable_bottle', np.equal, 0),), _REC_REUSABLE_BOTTLE),
+    ((('cleanup_participation', np.equal, 0),), _REC_BEACH_CLEANUP),
     # Food recommendations
-    if user_data['local_food'] < 0.5:
-        recommendations.append({
-            "category": "food",
-            "title": "Eat more local food",
-            "description": "Over 85% of Hawaii's food is imported. Support local farmers and reduce carbon emissions by choosing restaurants that serve locally-sourced ingredients, and shopping at farmers markets."
-        })
-    
-    if not user_data['seafood_sustainable']:
-        recommendations.append({
-            "category": "food",
-            "title": "Choose sustainable seafood",
-            "description": "Hawaii's marine ecosystems are fragile. When ordering seafood, ask about sustainable options or check the Seafood Watch app to make ocean-friendly choices."
-        })
-    
+    ((('local_food', np.less, 0.5),), _REC_LOCAL_FOOD),
+    ((('seafood_sustainable', np.equal, 0),), _REC_SUSTAINABLE_SEAFOOD),
     # Activities recommendations
-    if "Motorized water sports (jet ski, motorboats)" in user_data['activities'] or "ATV/off-road vehicle tours" in user_data['activities']:
-        recommendations.append({
-            "category": "activities",
-            "title": "Choose low-impact activities",
-            "description": "Consider eco-friendly alternatives like kayaking, paddleboarding, or electric boat tours that minimize noise pollution and marine ecosystem disruption."
-        })
-    
-    if "Snorkeling/scuba on coral reefs" in user_data['activities'] and not user_data['reef_safe']:
-        recommendations.append({
-            "category": "activities",
-            "title": "Use reef-safe sunscreen",
-            "description": "Hawaii has banned sunscreens containing oxybenzone and octinoxate because they damage coral reefs. Look for mineral-based sunscreens with zinc oxide or titanium dioxide."
-        })
-    
-    if "Wildlife viewing tours" in user_data['activities'] and not user_data['wildlife_distance']:
-        recommendations.append({
-            "category": "activities",
-            "title": "Maintain distance from wildlife",
-            "description": "Hawaii law requires keeping at least 50 feet from sea turtles, monk seals, and other protected species. Never touch or chase wildlife - observe respectfully from a distance."
-        })
+    ((('low_impact_trigger', np.equal, 1),), _REC_LOW_IMPACT_ACTIVITIES),
+    ((('reef_activity', np.equal, 1), ('reef_safe', np.equal, 0)), _REC_REEF_SAFE_SUNSCREEN),
+    ((('wildlife_activity', np.equal, 1), ('wildlife_distance', np.equal, 0)), _REC_WILDLIFE_DISTANCE)
+)
+
+# Rule table flattened into condition arrays; each rule's conditions are contiguous
+# and start at _RULE_CONDITION_STARTS, so one reduceat folds them back per rule
+_RECOMMENDATIONS = tuple(record for _, record in _RECOMMENDATION_RULES)
+_RULE_CONDITIONS = [condition for conditions, _ in _RECOMMENDATION_RULES for condition in conditions]
+_CONDITION_COLUMNS = np.array([_RULE_INPUT_INDEX[name] for name, _, _ in _RULE_CONDITIONS])
+_CONDITION_THRESHOLDS = np.array([threshold for _, _, threshold in _RULE_CONDITIONS], dtype=float)
+# Conditions grouped by comparison op, so each op is applied once per evaluation
+_CONDITION_OP_GROUPS = tuple(
+    (op, np.array([i for i, (_, condition_op, _) in enumerate(_RULE_CONDITIONS) if condition_op is op]))
+    for op in dict.fromkeys(op for _, op, _ in _RULE_CONDITIONS)
+)
+_RULE_CONDITION_STARTS = np.cumsum([0] + [len(conditions) for conditions, _ in _RECOMMENDATION_RULES[:-1]])
+
+# General recommendations added when fewer than three specific ones apply
+_GENERAL_RECOMMENDATIONS = (
+    MappingProxyType({
+        "category": Category.GENERAL,
+        "title": "Support Hawaiian conservation efforts",
+        "description": "Consider donating to local conservation organizations like The Nature Conservancy Hawaii or volunteering with a Malama Hawaii program during your stay."
+    }),
+    MappingProxyType({
+        "category": Category.GENERAL,
+        "title": "Learn about Hawaiian culture",
+        "description": "Understanding Hawaiian culture and values like 'malama 'aina' (caring for the land) can enhance your visit and inspire more sustainable choices. Visit cultural sites respectfully."
+    })
+)
+
+# Most recommendations shown; rules earlier in the table take priority
+_MAX_RECOMMENDATIONS = 5
+
+def get_recommendations(user_data, results):
+    """Generate personalized sustainability recommendations based on user data and results"""
+    # Copy so callers can reorder or extend the list without touching the cache
+    return list(_get_recommendations_cached(user_data))
+
+@functools.lru_cache(maxsize=128)
+def _get_recommendations_cached(user_data):
+    """Evaluate the recommendation rules for one set of inputs; see get_recommendations"""
+    applies = _recommendation_mask(_encode_rule_inputs(user_data))
+    recommendations = [_RECOMMENDATIONS[i] for i in np.flatnonzero(applies)[:_MAX_RECOMMENDATIONS]]
     
     # Add general recommendations if we have few specific ones
     if len(recommendations) < 3:
-        recommendations.append({
-            "category": "general",
-            "title": "Support Hawaiian conservation efforts",
-            "description": "Consider donating to local conservation organizations like The Nature Conservancy Hawaii or volunteering with a Malama Hawaii program during your stay."
-        })
-        
-        recommendations.append({
-            "category": "general",
-            "title": "Learn about Hawaiian culture",
-            "description": "Understanding Hawaiian culture and values like 'malama 'aina' (caring for the land) can enhance your visit and inspire more sustainable choices. Visit cultural sites respectfully."
-        })
+        recommendations.extend(_GENERAL_RECOMMENDATIONS)
     
-    return recommendations
+    return tuple(recommendations)
+
+def _encode_rule_inputs(user_data):
+    """Pack the inputs the recommendation rules test into a vector laid out by _RULE_INPUT_NAMES"""
+    activities = user_data.activities
+    return np.array([
+        user_data.local_transport in _RENTAL_CARS,
+        user_data.flight_distance,
+        user_data.accommodation_type in _FULL_SERVICE_ACCOMMODATIONS,
+        user_data.ac_usage,
+        user_data.linen_reuse,
+        user_data.shower_length,
+        user_data.pool_usage,
+        user_data.reusable_bottle,
+        user_data.cleanup_participation,
+        user_data.local_food,
+        user_data.seafood_sustainable,
+        not _LOW_IMPACT_TRIGGERS.isdisjoint(activities),
+        "Snorkeling/scuba on coral reefs" in activities,
+        user_data.reef_safe,
+        "Wildlife viewing tours" in activities,
+        user_data.wildlife_distance
+    ], dtype=float)
+
+def _recommendation_mask(rule_inputs):
+    """
+    Evaluate every recommendation rule in one pass. rule_inputs is an encoded
+    vector from _encode_rule_inputs, or an (N, len(_RULE_INPUT_NAMES)) stack of
+    them for several travellers at once. Returns a boolean mask aligned with
+    _RECOMMENDATIONS (one row per traveller for stacked input).
+    """
+    condition_inputs = rule_inputs[..., _CONDITION_COLUMNS]
+    conditions_met = np.empty(condition_inputs.shape, dtype=bool)
+    for op, positions in _CONDITION_OP_GROUPS:
+        conditions_met[..., positions] = op(condition_inputs[..., positions], _CONDITION_THRESHOLDS[positions])
+    return np.logical_and.reduceat(conditions_met, _RULE_CONDITION_STARTS, axis=-1)
 
 #############################
 # UI COMPONENTS
@@ -911,6 +943,18 @@ def display_header():
         Make your visit to Oahu more sustainable with personalized recommendations.
         """)
 
+# Score badge markup; only the label, color and score vary between calls
+_SCORE_HTML = string.Template("""
+    <div style="text-align: center; margin-bottom: 10px;">
+        <p style="margin-bottom: 5px; font-weight: bold;">$label</p>
+        <div style="position: relative; width: 150px; height: 150px; border-radius: 50%; background: #f0f0f0; margin: 0 auto;">
+            <div style="position: absolute; top: 5px; left: 5px; width: 140px; height: 140px; border-radius: 50%; background: $color; display: flex; justify-content: center; align-items: center;">
+                <span style="font-size: 36px; font-weight: bold; color: white;">$score</span>
+            </div>
+        </div>
+    </div>
+    """)
+
 def display_sustainability_score(score, category=None):
     """Display a sustainability score with visual indicator"""
     label = category if category else "Overall Sustainability Score"
@@ -919,16 +963,7 @@ def display_sustainability_score(score, category=None):
     color = get_score_color(score)
     
     # Create the score display
-    html_content = f"""
-    <div style="text-align: center; margin-bottom: 10px;">
-        <p style="margin-bottom: 5px; font-weight: bold;">{label}</p>
-        <div style="position: relative; width: 150px; height: 150px; border-radius: 50%; background: #f0f0f0; margin: 0 auto;">
-            <div style="position: absolute; top: 5px; left: 5px; width: 140px; height: 140px; border-radius: 50%; background: {color}; display: flex; justify-content: center; align-items: center;">
-                <span style="font-size: 36px; font-weight: bold; color: white;">{score}</span>
-            </div>
-        </div>
-    </div>
-    """
+    html_content = _SCORE_HTML.substitute(label=label, color=color, score=score)
     
     st.markdown(html_content, unsafe_allow_html=True)
 
@@ -939,44 +974,52 @@ def display_impact_metrics(results):
     with col1:
         st.metric(
             "Carbon Footprint", 
-            format_carbon(results['carbon_footprint']),
+            results['carbon_footprint_text'],
             help="Estimated carbon emissions from your trip, including flights, local transport, accommodation, food, and activities."
         )
     
     with col2:
         st.metric(
             "Water Usage", 
-            format_water(results['water_usage']) + " per day",
+            results['water_usage_text'],
             help="Estimated daily water consumption based on your accommodation, activities, and practices."
         )
     
     with col3:
         st.metric(
             "Waste Generation", 
-            f"{results['waste_generation']} lbs per day",
+            results['waste_generation_text'],
             help="Estimated daily waste generated based on your consumption patterns and reuse practices."
         )
 
+# Figures kept per chart; every distinct set of scores adds one
+_FIGURE_CACHE_ENTRIES = 128
+
 def display_radar_chart(results):
     """Display a radar chart of sustainability categories"""
-    categories = [
-        'Transport', 'Accommodation', 'Activities', 
-        'Water Use', 'Waste', 'Food'
-    ]
-    
-    values = [
+    values = (
         results['transport_score'],
         results['accommodation_score'],
         results['activities_score'],
         results['water_score'],
         results['waste_score'],
         results['food_score']
+    )
+    
+    st.plotly_chart(_build_radar_figure(values), use_container_width=True)
+
+@st.cache_resource(show_spinner=False, max_entries=_FIGURE_CACHE_ENTRIES)
+def _build_radar_figure(values):
+    """Build the radar chart figure for a tuple of category scores (shared; treat as read-only)"""
+    categories = [
+        'Transport', 'Accommodation', 'Activities', 
+        'Water Use', 'Waste', 'Food'
     ]
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
-        r=values,
+        r=list(values),
         theta=categories,
         fill='toself',
         fillcolor='rgba(76, 175, 80, 0.3)',
@@ -995,31 +1038,36 @@ def display_radar_chart(results):
         margin=dict(l=40, r=40, b=40, t=40)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 def display_breakdown_chart(results):
     """Display a pie chart of impact breakdown"""
     impact = results['impact_breakdown']
     
-    labels = [
-        'Transportation', 'Accommodation', 'Activities',
-        'Water Use', 'Waste', 'Food'
-    ]
-    
-    values = [
+    values = (
         impact['transport'],
         impact['accommodation'],
         impact['activities'],
         impact['water'],
         impact['waste'],
         impact['food']
+    )
+    
+    st.plotly_chart(_build_breakdown_figure(values), use_container_width=True)
+
+@st.cache_resource(show_spinner=False, max_entries=_FIGURE_CACHE_ENTRIES)
+def _build_breakdown_figure(values):
+    """Build the impact breakdown pie chart for a tuple of category shares (shared; treat as read-only)"""
+    labels = [
+        'Transportation', 'Accommodation', 'Activities',
+        'Water Use', 'Waste', 'Food'
     ]
     
     colors = ['#FF9800', '#2196F3', '#9C27B0', '#03A9F4', '#8BC34A', '#FF5722']
     
     fig = go.Figure(data=[go.Pie(
         labels=labels,
-        values=values,
+        values=list(values),
         hole=.4,
         marker=dict(colors=colors)
     )])
@@ -1030,99 +1078,115 @@ def display_breakdown_chart(results):
         margin=dict(l=40, r=40, b=40, t=60)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 def display_recommendations(recommendations):
     """Display personalized sustainability recommendations"""
     st.subheader("Personalized Recommendations")
     
-    for i, rec in enumerate(recommendations[:5]):  # Show top 5 recommendations
+    for rec in recommendations:  # get_recommendations already caps these at _MAX_RECOMMENDATIONS
         with st.expander(f"{get_recommendation_icon(rec['category'])} {rec['title']}"):
             st.markdown(rec['description'])
 
+# Resource catalogue formatted once as (tab label, ((link, description) markdown, ...)) pairs
+_RESOURCE_TABS = tuple(
+    (category, tuple(
+        (f"**[{resource['name']}]({resource['url']})**", resource['description'])
+        for resource in resource_list
+    ))
+    for category, resource_list in _OAHU_RESOURCES.items()
+)
+
 def display_resources():
     """Display educational resources for sustainable tourism in Oahu"""
     st.subheader("Sustainable Tourism Resources")
     
-    resources = get_oahu_tourist_resources()
-    
-    tabs = st.tabs(list(resources.keys()))
+    tabs = st.tabs([category for category, _ in _RESOURCE_TABS])
     
-    for i, (category, resource_list) in enumerate(resources.items()):
-        with tabs[i]:
-            for resource in resource_list:
-                st.markdown(f"**[{resource['name']}]({resource['url']})**")
-                st.markdown(resource['description'])
+    for tab, (category, resource_list) in zip(tabs, _RESOURCE_TABS):
+        with tab:
+            for link, description in resource_list:
+                st.markdown(link)
+                st.markdown(description)
                 st.markdown("---")
 
+# Average tourist values: carbon (tons for 1-week trip), water (gallons per day), waste (pounds per day)
+_AVERAGE_TOURIST = np.array([1.2, 250, 5.2])
+_COMPARISON_LABELS = (
+    "Your Carbon vs Average Tourist",
+    "Your Water Use vs Average Tourist",
+    "Your Waste vs Average Tourist"
+)
+
+# Overall score context, highest band first; the last band catches everything else
+_SCORE_BANDS = (
+    (80, "Excellent! You're a sustainable tourism champion."),
+    (60, "Good job! Your vacation has a lower-than-average impact."),
+    (40, "Average impact. Some simple changes could make a big difference."),
+    (float('-inf'), "Higher impact than most. Check recommendations to improve.")
+)
+
 def display_comparison(results):
     """Display comparison to average tourist"""
     col1, col2 = st.columns(2)
     
-    # Average tourist values
-    avg_carbon = 1.2  # tons for 1-week trip
-    avg_water = 250   # gallons per day
-    avg_waste = 5.2   # pounds per day
-    
     user_carbon = results['carbon_footprint']
     user_water = results['water_usage']
     user_waste = results['waste_generation']
     
-    # Carbon comparison
-    carbon_diff = ((avg_carbon - user_carbon) / avg_carbon) * 100
-    carbon_status = "lower" if carbon_diff > 0 else "higher"
-    carbon_color = "normal" if carbon_diff > 0 else "off"
-    
-    with col1:
-        st.metric(
-            "Your Carbon vs Average Tourist", 
-            format_carbon(user_carbon),
-            f"{abs(carbon_diff):.1f}% {carbon_status}",
-            delta_color=carbon_color
-        )
-    
-    # Water comparison
-    water_diff = ((avg_water - user_water) / avg_water) * 100
-    water_status = "lower" if water_diff > 0 else "higher"
-    water_color = "normal" if water_diff > 0 else "off"
-    
-    with col2:
-        st.metric(
-            "Your Water Use vs Average Tourist", 
-            format_water(user_water) + " per day",
-            f"{abs(water_diff):.1f}% {water_status}",
-            delta_color=water_color
-        )
+    # Percent difference from the average tourist for all three metrics at once
+    diffs = (_AVERAGE_TOURIST - np.array([user_carbon, user_water, user_waste])) / _AVERAGE_TOURIST * 100
+    statuses = np.where(diffs > 0, "lower", "higher")
+    colors = np.where(diffs > 0, "normal", "off")
     
-    # Waste comparison
-    waste_diff = ((avg_waste - user_waste) / avg_waste) * 100
-    waste_status = "lower" if waste_diff > 0 else "higher"
-    waste_color = "normal" if waste_diff > 0 else "off"
+    values = (
+        results['carbon_footprint_text'],
+        results['water_usage_text'],
+        results['waste_generation_text']
+    )
     
-    with col1:
-        st.metric(
-            "Your Waste vs Average Tourist", 
-            f"{user_waste} lbs per day",
-            f"{abs(waste_diff):.1f}% {waste_status}",
-            delta_color=waste_color
-        )
+    for col, label, value, diff, status, color in zip(
+        (col1, col2, col1), _COMPARISON_LABELS, values, diffs, statuses, colors
+    ):
+        with col:
+            st.metric(label, value, f"{abs(diff):.1f}% {status}", delta_color=str(color))
     
     # Overall score context
     with col2:
-        score_context = ""
         score = results['overall_score']
-        
-        if score >= 80:
-            score_context = "Excellent! You're a sustainable tourism champion."
-        elif score >= 60:
-            score_context = "Good job! Your vacation has a lower-than-average impact."
-        elif score >= 40:
-            score_context = "Average impact. Some simple changes could make a big difference."
-        else:
-            score_context = "Higher impact than most. Check recommendations to improve."
+        score_context = next(message for threshold, message in _SCORE_BANDS if score >= threshold)
         
         st.info(score_context)
 
+def display_results(results, recommendations):
+    """Display the calculated results section"""
+    st.header("Your Sustainability Results")
+    
+    # Bordered containers separate the sections instead of horizontal rules
+    with st.container(border=True):
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            display_sustainability_score(results['overall_score'])
+        
+        with col2:
+            display_impact_metrics(results)
+    
+    with st.container(border=True):
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            display_radar_chart(results)
+        
+        with col4:
+            display_breakdown_chart(results)
+    
+    with st.container(border=True):
+        display_comparison(results)
+    
+    with st.container(border=True):
+        display_recommendations(recommendations)
+
 #############################
 # INPUT FORM
 #############################
@@ -1157,29 +1221,14 @@ def input_form():
             # Local transportation
             local_transport = st.selectbox(
                 "Primary transportation method on Oahu",
-                options=[
-                    "Rental EV",
-                    "Rental hybrid",
-                    "Rental economy car",
-                    "Rental SUV/large vehicle",
-                    "Public transportation/shuttle",
-                    "Mostly walking/biking",
-                    "Rideshare/taxi"
-                ],
+                options=_LOCAL_TRANSPORT_CHOICES,
                 help="How you'll primarily get around during your stay"
             )
             
             # Accommodation
             accommodation_type = st.selectbox(
                 "Accommodation type",
-                options=[
-                    "Eco-certified hotel/resort",
-                    "Standard hotel/resort",
-                    "Luxury resort",
-                    "Vacation rental",
-                    "Hostel/budget accommodation",
-                    "Camping/outdoor lodging"
-                ],
+                options=_ACCOMMODATION_CHOICES,
                 help="Type of accommodation during your stay"
             )
             
@@ -1305,18 +1354,7 @@ def input_form():
             # Activities
             activities = st.multiselect(
                 "Planned activities",
-                options=[
-                    "Snorkeling/scuba on coral reefs",
-                    "Motorized water sports (jet ski, motorboats)",
-                    "Hiking on maintained trails",
-                    "Off-trail hiking/exploration",
-                    "Wildlife viewing tours",
-                    "ATV/off-road vehicle tours",
-                    "Shopping/dining",
-                    "Cultural sites/museums",
-                    "Beach relaxation",
-                    "Surfing/paddleboarding"
-                ],
+                options=_ACTIVITY_NAMES,
                 default=["Snorkeling/scuba on coral reefs", "Hiking on maintained trails", "Beach relaxation"],
                 help="Activities you plan to participate in during your visit"
             )
@@ -1346,29 +1384,29 @@ def input_form():
         
         if submit_button:
             # Compile user data
-            user_data = {
-                'duration': duration,
-                'flight_distance': flight_distance,
-                'local_transport': local_transport,
-                'accommodation_type': accommodation_type,
-                'ac_usage': ac_usage,
-                'water_conservation': water_conservation,
-                'linen_reuse': linen_reuse,
-                'reusable_bottle': reusable_bottle,
-                'reusable_bag': reusable_bag,
-                'refuse_single_use': refuse_single_use,
-                'cleanup_participation': cleanup_participation,
-                'plant_based': plant_based,
-                'local_food': local_food,
-                'seafood_sustainable': seafood_sustainable,
-                'food_waste': food_waste,
-                'shower_length': shower_length,
-                'pool_usage': pool_usage,
-                'activities': activities,
-                'reef_safe': reef_safe,
-                'wildlife_distance': wildlife_distance,
-                'eco_tours': eco_tours
-            }
+            user_data = UserData(
+                duration=duration,
+                flight_distance=flight_distance,
+                local_transport=local_transport,
+                accommodation_type=accommodation_type,
+                ac_usage=ac_usage,
+                water_conservation=water_conservation,
+                linen_reuse=linen_reuse,
+                reusable_bottle=reusable_bottle,
+                reusable_bag=reusable_bag,
+                refuse_single_use=refuse_single_use,
+                cleanup_participation=cleanup_participation,
+                plant_based=plant_based,
+                local_food=local_food,
+                seafood_sustainable=seafood_sustainable,
+                food_waste=food_waste,
+                shower_length=shower_length,
+                pool_usage=pool_usage,
+                activities=frozenset(activities),
+                reef_safe=reef_safe,
+                wildlife_distance=wildlife_distance,
+                eco_tours=eco_tours
+            )
             
             # Store in session state
             st.session_state.user_data = user_data
@@ -1382,6 +1420,9 @@ def input_form():
 # MAIN APP FUNCTION
 #############################
 
+# Session state written by input_form; clearing these returns to the form
+_RESULT_STATE_KEYS = ('results', 'user_data', 'recommendations')
+
 def main():
     display_header()
     
@@ -1389,46 +1430,15 @@ def main():
         input_form()
     else:
         # Display results
-        st.header("Your Sustainability Results")
-        
-        results = st.session_state.results
-        
-        col1, col2 = st.columns([1, 3])
-        
-        with col1:
-            display_sustainability_score(results['overall_score'])
-        
-        with col2:
-            display_impact_metrics(results)
-        
-        st.markdown("---")
-        
-        col3, col4 = st.columns(2)
-        
-        with col3:
-            display_radar_chart(results)
-        
-        with col4:
-            display_breakdown_chart(results)
-        
-        st.markdown("---")
-        
-        display_comparison(results)
-        
-        st.markdown("---")
-        
-        display_recommendations(st.session_state.recommendations)
-        
-        st.markdown("---")
-        
-        display_resources()
+        display_results(st.session_state.results, st.session_state.recommendations)
         
-        st.markdown("---")
+        with st.container(border=True):
+            display_resources()
         
         if st.button("Calculate Again"):
             # Clear session state and return to input form
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            for key in _RESULT_STATE_KEYS:
+                st.session_state.pop(key, None)
             st.rerun()
 
 if __name__ == "__main__":